@@ -1,5 +1,7 @@
-from random import random
+import math
+from enum import IntEnum
 from typing import Union
+import numpy as np
 import pygame
 from pygame.locals import *
 from vector import Vector2  #! Why is this not used?
@@ -15,11 +17,151 @@ if TYPE_CHECKING:
     from game.nodes import Node
     from game.ghosts import Ghost
 
+# Board cell codes
+EMPTY_CODE = 0
+PELLET_CODE = 1
+POWER_PELLET_CODE = 2
+
+BOARD_CODES = {"PELLET": PELLET_CODE, "POWER_PELLET": POWER_PELLET_CODE}
+
+
+class FSMState(IntEnum):
+    SEARCH = 0
+    CHASE = 1
+    ATTACK = 2
+    EVADE = 3
+
+
+# Transition condition flags
+POWER_PELLET_NEARBY = 1
+NON_VULNERABLE_GHOST_NEARBY = 2
+VULNERABLE_GHOST_NEARBY = 4
+ATE_POWER_PELLET = 8
+ATE_VULNERABLE_GHOST = 16
+
+
+def next_state(state: FSMState, flags: int) -> FSMState:
+    """
+    Returns the state that follows the given state under the given
+    combination of condition flags. See PacManFSM.update_state for the rules.
+
+    Parameters
+    ----------
+    state : FSMState
+        The current state
+    flags : int
+        Bitmask of the transition condition flags
+
+    Returns
+    -------
+    FSMState
+        The next state
+    """
+    if state is FSMState.SEARCH:
+        if flags & POWER_PELLET_NEARBY:
+            return FSMState.CHASE
+        if flags & NON_VULNERABLE_GHOST_NEARBY:
+            return FSMState.EVADE
+    elif state is FSMState.CHASE:
+        if flags & ATE_POWER_PELLET and flags & VULNERABLE_GHOST_NEARBY:
+            return FSMState.ATTACK
+        if flags & NON_VULNERABLE_GHOST_NEARBY:
+            return FSMState.EVADE
+    elif state is FSMState.ATTACK:
+        if not flags & VULNERABLE_GHOST_NEARBY or flags & ATE_VULNERABLE_GHOST:
+            return FSMState.SEARCH
+    elif state is FSMState.EVADE:
+        if not flags & NON_VULNERABLE_GHOST_NEARBY:
+            return FSMState.SEARCH
+        if flags & POWER_PELLET_NEARBY:
+            return FSMState.CHASE
+    return state
+
+
+# TRANSITIONS[state][flags] -> next state, for every combination of flags
+TRANSITIONS = tuple(
+    tuple(next_state(state, flags) for flags in range(32)) for state in FSMState
+)
+
 
 class PacManFSM(PacMan):
-    def __init__(self):
-        self.state = "Search"
+    def __init__(self, grid_size: int = 3):
+        self.state = FSMState.SEARCH
         self.environment = None
+        self.board_codes = None
+        self.grid_size = grid_size
+        self.pellet_grid = {}
+        self.powerpellet_grid = {}
+        self.grid_neighborhoods = {}
+        # Set whenever something happens that could change the state or the
+        # chosen action: crossing a node, eating a pellet or a ghost changing
+        # vulnerability. Callers raising ghost events should set it too.
+        self.stateDirty = True
+        # Action handler for each state, keyed by FSMState. States with no
+        # behaviour yet are left out.
+        self.actions = {FSMState.SEARCH: self.search}
+
+    def set_board(self, game_board: list) -> None:
+        """
+        Encodes the game board once as a 2-D array of cell codes and buckets
+        every pellet and power pellet into a uniform grid of grid_size cells.
+
+        Pellets never move, so the grids only change when a pellet is eaten.
+
+        Parameters
+        ----------
+        game_board : list
+            2-D list of cell names, e.g. "PELLET" or "POWER_PELLET"
+        """
+        self.board_codes = np.array(
+            [[BOARD_CODES.get(cell, EMPTY_CODE) for cell in row] for row in game_board],
+            dtype=np.int8,
+        )
+        self.pellet_grid = self.build_grid(PELLET_CODE)
+        self.powerpellet_grid = self.build_grid(POWER_PELLET_CODE)
+
+    def build_grid(self, code: int) -> dict:
+        """
+        Buckets the (x, y) cells holding the given code by grid cell.
+
+        Parameters
+        ----------
+        code : int
+            The board code to bucket
+
+        Returns
+        -------
+        dict
+            Mapping of (x // grid_size, y // grid_size) to a list of (x, y) cells
+        """
+        grid = {}
+        for y, x in np.argwhere(self.board_codes == code).tolist():
+            key = (x // self.grid_size, y // self.grid_size)
+            grid.setdefault(key, []).append((x, y))
+        return grid
+
+    def clear_cell(self, x: int, y: int) -> None:
+        """
+        Marks a board cell as empty after its pellet has been eaten and removes
+        it from its grid bucket.
+
+        Parameters
+        ----------
+        x : int
+            The column of the cell
+        y : int
+            The row of the cell
+        """
+        code = self.board_codes[y, x]
+        if code == PELLET_CODE:
+            grid = self.pellet_grid
+        elif code == POWER_PELLET_CODE:
+            grid = self.powerpellet_grid
+        else:
+            return
+        self.board_codes[y, x] = EMPTY_CODE
+        grid[(x // self.grid_size, y // self.grid_size)].remove((x, y))
+        self.stateDirty = True
 
     def update(self, game):
         """
@@ -40,11 +182,17 @@ class PacManFSM(PacMan):
         """
         #! Add "Eat" state???
         #! Attack vs Chase
-        dt = game.dt
-        self.sprites.update(dt)
-        self.position += self.directions[self.direction] * self.speed * dt
-        self.update_state()
-        self.action()
+        self.sprites.update(game.dt)
+        # Skip PacMan.update, which steers from the keyboard, and use the
+        # shared Entity movement with its overshoot and portal handling
+        node = self.node
+        Entity.update(self, game)
+        if self.node is not node:
+            self.stateDirty = True
+        if self.stateDirty:
+            self.update_state()
+            self.action()
+            self.stateDirty = False
 
     def update_state(self) -> None:
         """
@@ -67,29 +215,34 @@ class PacManFSM(PacMan):
             nearby, then the PacMan moves to the search state.
         7. If the PacMan is in the evade state and a power pellet is nearby, then
             the PacMan moves to the chase state.
-        """
-
-        if self.state == "Search":
-            if self.power_pellet_nearby():
-                self.state = "Chase"
-            elif self.non_vulnerable_ghost_nearby():
-                self.state = "Evade"
 
-        elif self.state == "Chase":
-            if self.ate_power_pellet() and self.vulnerable_ghost_nearby():
-                self.state = "Attack"
-            elif self.non_vulnerable_ghost_nearby():
-                self.state = "Evade"
-
-        elif self.state == "Attack":
-            if not self.vulnerable_ghost_nearby() or self.ate_vulnerable_ghost():
-                self.state = "Search"
+        Every condition is evaluated exactly once into a bitmask of flags and
+        the next state is read from the precomputed TRANSITIONS table.
+        """
+        environment = self.environment
+        flags = 0
+        if self.power_pellet_nearby(self.board_position()):
+            flags |= POWER_PELLET_NEARBY
+        if self.non_vulnerable_ghost_nearby(environment):
+            flags |= NON_VULNERABLE_GHOST_NEARBY
+        if self.vulnerable_ghost_nearby(environment):
+            flags |= VULNERABLE_GHOST_NEARBY
+        if self.ate_power_pellet(environment):
+            flags |= ATE_POWER_PELLET
+        if self.ate_vulnerable_ghost(environment):
+            flags |= ATE_VULNERABLE_GHOST
+        self.state = TRANSITIONS[self.state][flags]
+
+    def board_position(self) -> tuple:
+        """
+        Returns the (x, y) board cell that Pac-Man is currently in.
 
-        elif self.state == "Evade":
-            if not self.non_vulnerable_ghost_nearby():
-                self.state = "Search"
-            elif self.power_pellet_nearby():
-                self.state = "Chase"
+        Returns
+        -------
+        tuple
+            The (x, y) board cell of Pac-Man
+        """
+        return int(self.position.x // TILEWIDTH), int(self.position.y // TILEHEIGHT)
 
     def search(self):
         """
@@ -101,44 +254,48 @@ class PacManFSM(PacMan):
         #! Just set the direction in this method
         next_direction = None
 
-        if self.power_pellet_nearby():
+        board_position = self.board_position()
+        if self.power_pellet_nearby(board_position):
             next_direction = self.move_towards_power_pellet()
-        elif self.pellet_nearby():
-            next_direction = self.move_towards_nearest_pellet()
+        elif self.pellet_nearby(board_position):
+            next_direction = self.move_towards_nearest_pellet(self.environment)
         else:
-            valid_directions = self.valid_directions()
-            next_direction = random.choice(valid_directions)
+            next_direction = self.random_direction(self.valid_directions())
 
         return next_direction
 
     def action(self):
         #! change method name to update_direction???
-        if self.state == "Search":
-            next_direction = self.search()
-        elif self.state == "Chase":
-            pass
-        elif self.state == "Attack":
-            pass
-        elif self.state == "Evade":
-            pass
-
-    def pellet_nearby(self):
+        handler = self.actions.get(self.state)
+        if handler is not None:
+            direction = handler()
+            # The movement stubs return None until they are implemented, in
+            # which case Pac-Man keeps its current direction
+            if direction is not None:
+                target = self.get_new_target(direction)
+                if target is not self.node:
+                    self.direction = direction
+                    self.target = target
+
+    def pellet_nearby(self, pacman_position, threshold_distance=1):
         """
-        Checks the direct up, down, left, and right cells for power pellets.
+        Checks the direct up, down, left, and right cells for pellets.
 
         Parameters
         ----------
-        environment : dict
-            The game environment
+        pacman_position : tuple
+            The (x, y) board cell of Pac-Man
+        threshold_distance : int
+            The Manhattan distance to search within
 
         Returns
         -------
         bool
-            True if a power pellet is found, False otherwise
+            True if a pellet is found, False otherwise
         """
-        pacman_x, pacman_y = self.position
+        return self.grid_nearby(self.pellet_grid, pacman_position, threshold_distance)
 
-    def power_pellet_nearby(self, pacman_position, game_board, threshold_distance=3):
+    def power_pellet_nearby(self, pacman_position, threshold_distance=3):
         """
         Check if a power pellet is nearby Pac-Man.
 
@@ -151,22 +308,78 @@ class PacManFSM(PacMan):
         Parameters
         ----------
         pacman_position : tuple
+            The (x, y) board cell of Pac-Man
+        threshold_distance : int
+            The Manhattan distance to search within
 
+        Returns
+        -------
+        bool
+            True if a power pellet is found, False otherwise
         """
-        pacman_x, pacman_y = pacman_position
+        return self.grid_nearby(
+            self.powerpellet_grid, pacman_position, threshold_distance
+        )
+
+    def grid_nearby(
+        self, grid: dict, pacman_position: tuple, threshold_distance: int
+    ) -> bool:
+        """
+        Checks if any cell bucketed in the grid is within a Manhattan distance
+        of threshold_distance from Pac-Man.
+
+        Only the grid cells that can hold a nearby cell are visited, which is
+        the 3x3 neighborhood when threshold_distance <= grid_size.
 
-        # Iterate over the game board
-        for y in range(len(game_board)):
-            for x in range(len(game_board[y])):
-                # Check if the current cell contains a power pellet
-                if game_board[y][x] == "POWER_PELLET":
-                    # Calculate the Manhattan distance between Pac-Man and the power pellet
-                    distance = abs(pacman_x - x) + abs(pacman_y - y)
-                    if distance <= threshold_distance:
-                        return True
+        Parameters
+        ----------
+        grid : dict
+            Mapping of grid cell to a list of (x, y) board cells
+        pacman_position : tuple
+            The (x, y) board cell of Pac-Man
+        threshold_distance : int
+            The Manhattan distance to search within
 
+        Returns
+        -------
+        bool
+            True if any cell is nearby, False otherwise
+        """
+        pacman_x, pacman_y = pacman_position
+        cx = pacman_x // self.grid_size
+        cy = pacman_y // self.grid_size
+        for dx, dy in self.grid_neighborhood(threshold_distance):
+            for x, y in grid.get((cx + dx, cy + dy), ()):
+                if abs(pacman_x - x) + abs(pacman_y - y) <= threshold_distance:
+                    return True
         return False
 
+    def grid_neighborhood(self, threshold_distance: int) -> tuple:
+        """
+        Returns the (dx, dy) grid cell offsets that grid_nearby has to visit
+        for a threshold distance, built once per distance and reused.
+
+        Parameters
+        ----------
+        threshold_distance : int
+            The Manhattan distance to search within
+
+        Returns
+        -------
+        tuple
+            The grid cell offsets around Pac-Man's grid cell
+        """
+        offsets = self.grid_neighborhoods.get(threshold_distance)
+        if offsets is None:
+            reach = math.ceil(threshold_distance / self.grid_size)
+            offsets = tuple(
+                (dx, dy)
+                for dx in range(-reach, reach + 1)
+                for dy in range(-reach, reach + 1)
+            )
+            self.grid_neighborhoods[threshold_distance] = offsets
+        return offsets
+
     def non_vulnerable_ghost_nearby(self, environment):
         return False
 
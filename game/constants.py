@@ -20,10 +20,13 @@ GREEN = (0, 255, 0)
 # Directions
 STOP = 0
 UP = 1
-DOWN = -1
-LEFT = 2
-RIGHT = -2
-PORTAL = 3
+DOWN = 2
+LEFT = 3
+RIGHT = 4
+PORTAL = 5
+MOVEDIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+# OPPOSITE[direction] is the reverse of direction; portals lead both ways
+OPPOSITE = (STOP, DOWN, UP, RIGHT, LEFT, PORTAL)
 
 # Sprites
 PACMAN = 0
@@ -35,6 +38,9 @@ PINKY = 5
 INKY = 6
 CLYDE = 7
 FRUIT = 8
+# Node access packs one bit per entity name for each direction: bit
+# (direction * ACCESSBITS + name) is set if that entity may move that way
+ACCESSBITS = FRUIT + 1
 
 # Ghost states
 SCATTER = 0
@@ -48,3 +54,6 @@ LEVELTXT = 1
 READYTXT = 2
 PAUSETXT = 3
 GAMEOVERTXT = 4
+
+# Debugging
+DEBUG_RENDER_NODES = False
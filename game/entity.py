@@ -3,12 +3,17 @@ import pygame
 from pygame.locals import *
 from vector import Vector2
 from constants import *
-from random import randint
+import numpy as np
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from game.nodes import Node
 
+RANDOM_BUFFER_SIZE = 1024
+# Random picks are drawn from [0, RANDOM_RANGE), which divides evenly by every
+# possible number of directions (1 to 4), so no direction is favoured
+RANDOM_RANGE = 240
+
 
 class Entity(ABC):
     """
@@ -18,12 +23,15 @@ class Entity(ABC):
     ----------
     name : str
         The name of the entity.
-    directions : dict
-        A dictionary of directions, mapping direction constants to Vector2 objects.
+    directions : tuple
+        The unit Vector2 for each direction, indexed by direction constant.
     direction : int
         The current direction of the entity.
     speed : float
         The speed of the entity.
+    velocities : tuple
+        The direction vectors scaled by the entity's speed, indexed by
+        direction constant. Rebuilt whenever the speed changes.
     radius : int
         The radius of the entity.
     collideRadius : int
@@ -38,6 +46,13 @@ class Entity(ABC):
         The goal position of the entity.
     directionMethod : function
         The method used to determine the entity's direction.
+    rng : np.random.Generator
+        The random number generator used to pick random directions, shared by
+        every entity so a game can be replayed from one seed.
+    randomBuffer : list
+        A batch of pre-drawn random integers consumed by random_direction.
+    randomIndex : int
+        The index of the next unused value in randomBuffer.
     node : Node
         The current node of the entity.
     startNode : Node
@@ -56,6 +71,8 @@ class Entity(ABC):
     update(dt)
         Updates the entity's position based on its current direction and speed,
         taking into account the elapsed time (dt).
+    move(dt)
+        Advances the entity's position in place along its current velocity.
     valid_direction(direction)
         Checks if the entity can move in the given direction.
     get_new_target(direction)
@@ -71,6 +88,10 @@ class Entity(ABC):
         Gets a list of valid directions for the entity.
     random_direction(directions)
         Gets a random direction from the given list of directions.
+    refill_random_buffer()
+        Draws a new batch of random integers for random_direction.
+    seed_random(seed)
+        Reseeds the random number generator shared by every entity.
     goal_direction(directions)
         Gets the direction that is closest to the entity's goal.
     set_start_node(node)
@@ -86,6 +107,30 @@ class Entity(ABC):
         Renders the entity.
     """
 
+    __slots__ = (
+        "name",
+        "directions",
+        "direction",
+        "speed",
+        "velocities",
+        "radius",
+        "collideRadius",
+        "color",
+        "visible",
+        "disable_portal",
+        "goal",
+        "directionMethod",
+        "startNode",
+        "node",
+        "target",
+        "position",
+        "image",
+        "randomBuffer",
+        "randomIndex",
+    )
+
+    rng = np.random.default_rng()
+
     def __init__(self, node: "Node") -> None:
         """
         Initializes various attributes for the entity, including its name,
@@ -101,13 +146,13 @@ class Entity(ABC):
             The starting node of the entity.
         """
         self.name = None
-        self.directions = {
-            UP: Vector2(0, -1),
-            DOWN: Vector2(0, 1),
-            LEFT: Vector2(-1, 0),
-            RIGHT: Vector2(1, 0),
-            STOP: Vector2(),
-        }
+        self.directions = (
+            Vector2(),  # STOP
+            Vector2(0, -1),  # UP
+            Vector2(0, 1),  # DOWN
+            Vector2(-1, 0),  # LEFT
+            Vector2(1, 0),  # RIGHT
+        )
         self.direction = STOP
         self.set_speed(100)
         self.radius = 10
@@ -117,6 +162,7 @@ class Entity(ABC):
         self.disable_portal = False
         self.goal = None
         self.directionMethod = self.random_direction
+        self.refill_random_buffer()
         self.set_start_node(node)
         self.image = None
 
@@ -142,8 +188,7 @@ class Entity(ABC):
         dt : float
             The elapsed time since the last update.
         """
-        dt = game.dt
-        self.position += self.directions[self.direction] * self.speed * dt
+        self.move(game.dt)
 
         if self.over_shot_target():
             self.node = self.target
@@ -161,6 +206,20 @@ class Entity(ABC):
 
             self.set_position()
 
+    def move(self, dt: float) -> None:
+        """
+        Advances the entity's position in place along the velocity of its
+        current direction, without allocating intermediate vectors.
+
+        Parameters
+        ----------
+        dt : float
+            The elapsed time since the last update.
+        """
+        velocity = self.velocities[self.direction]
+        self.position.x += velocity.x * dt
+        self.position.y += velocity.y * dt
+
     def valid_direction(self, direction: int) -> bool:
         """
         Checks if the entity can move in the given direction.
@@ -175,10 +234,9 @@ class Entity(ABC):
         bool
             True if the entity can move in the given direction, False otherwise.
         """
-        if direction is not STOP:
-            if self.name in self.node.access[direction]:
-                if self.node.neighbors[direction] is not None:
-                    return True
+        if self.node.access >> (direction * ACCESSBITS + self.name) & 1:
+            if self.node.neighbors[direction] is not None:
+                return True
         return False
 
     def targets(self) -> list:
@@ -190,7 +248,6 @@ class Entity(ABC):
         list
             A list of target nodes for the entity.
         """
-        #! double check this
         return [x for x in self.node.neighbors if x is not None]
 
     def get_new_target(self, direction: int) -> "Node":
@@ -224,18 +281,20 @@ class Entity(ABC):
             True if the entity has overshot its target node, False otherwise.
         """
         if self.target is not None:
-            vec1 = self.target.position - self.node.position
-            vec2 = self.position - self.node.position
-            node2Target = vec1.magnitude_squared()
-            node2Self = vec2.magnitude_squared()
-            return node2Self >= node2Target
+            node = self.node.position
+            target = self.target.position
+            tx = target.x - node.x
+            ty = target.y - node.y
+            sx = self.position.x - node.x
+            sy = self.position.y - node.y
+            return sx * sx + sy * sy >= tx * tx + ty * ty
         return False
 
     def reverse_direction(self) -> None:
         """
         Reverses the entity's direction.
         """
-        self.direction *= -1
+        self.direction = OPPOSITE[self.direction]
         temp = self.node
         self.node = self.target
         self.target = temp
@@ -257,11 +316,11 @@ class Entity(ABC):
             direction, False otherwise.
         """
         if direction is not STOP:
-            if direction == self.direction * -1:
+            if direction == OPPOSITE[self.direction]:
                 return True
         return False
 
-    def valid_directions(self) -> list:
+    def valid_directions(self) -> tuple:
         """
         Gets a list of valid directions for the entity.
 
@@ -271,19 +330,14 @@ class Entity(ABC):
         If the entity cannot move in any direction, it adds the opposite of its
         current direction to the list of valid directions.
 
+        The result is looked up from the current node's cache.
+
         Returns
         -------
-        list
-            A list of valid directions for the entity.
+        tuple
+            The valid directions for the entity.
         """
-        directions = []
-        for key in [UP, DOWN, LEFT, RIGHT]:
-            if self.valid_direction(key):
-                if key != self.direction * -1:
-                    directions.append(key)
-        if len(directions) == 0:
-            directions.append(self.direction * -1)
-        return directions
+        return self.node.valid_directions(self.name, self.direction)
 
     def random_direction(self, directions: list) -> int:
         """
@@ -299,7 +353,34 @@ class Entity(ABC):
         int
             A random direction from the given list of directions.
         """
-        return directions[randint(0, len(directions) - 1)]
+        if self.randomIndex == RANDOM_BUFFER_SIZE:
+            self.refill_random_buffer()
+        value = self.randomBuffer[self.randomIndex]
+        self.randomIndex += 1
+        return directions[value % len(directions)]
+
+    def refill_random_buffer(self) -> None:
+        """
+        Draws a new batch of random integers for random_direction, so the
+        generator is only called once every RANDOM_BUFFER_SIZE picks.
+        """
+        self.randomBuffer = self.rng.integers(
+            0, RANDOM_RANGE, size=RANDOM_BUFFER_SIZE
+        ).tolist()
+        self.randomIndex = 0
+
+    @classmethod
+    def seed_random(cls, seed: int = None) -> None:
+        """
+        Reseeds the random number generator shared by every entity. Entities
+        created afterwards draw the same directions for the same seed.
+
+        Parameters
+        ----------
+        seed : int, optional
+            The seed for the generator, or None for a fresh unpredictable one.
+        """
+        Entity.rng = np.random.default_rng(seed)
 
     def goal_direction(self, directions: list) -> int:
         """
@@ -315,15 +396,21 @@ class Entity(ABC):
         int
             The direction that is closest to the entity's goal.
         """
-        distances = []
+        offsets = self.node.goalOffsets
+        goal_x = self.goal.x
+        goal_y = self.goal.y
+        best_direction = directions[0]
+        best_distance = float("inf")
         for direction in directions:
-            vec = (
-                self.node.position + self.directions[direction] * TILEWIDTH - self.goal
-            )
-            distances.append(vec.magnitude_squared())
-        index = distances.index(min(distances))
+            x, y = offsets[direction]
+            dx = x - goal_x
+            dy = y - goal_y
+            distance = dx * dx + dy * dy
+            if distance < best_distance:
+                best_direction = direction
+                best_distance = distance
 
-        return directions[index]
+        return best_direction
 
     def set_start_node(self, node: "Node") -> None:
         """
@@ -360,12 +447,13 @@ class Entity(ABC):
         """
         self.set_start_node(self.startNode)
         self.direction = STOP
-        self.speed = 100
+        self.set_speed(100)
         self.visible = True
 
     def set_speed(self, speed: float) -> None:
         """
-        Sets the entity's speed based on a given value.
+        Sets the entity's speed based on a given value and rebuilds the
+        per-direction velocities.
 
         Parameters
         ----------
@@ -373,6 +461,7 @@ class Entity(ABC):
             The speed of the entity.
         """
         self.speed = speed * TILEWIDTH / 16
+        self.velocities = tuple(vector * self.speed for vector in self.directions)
 
     def render(self, screen: pygame.Surface) -> None:
         """
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
     from game.nodes import Node
     from game.pacman import PacMan
 
+# Clyde heads for his scatter corner when Pac-Man is within 8 tiles
+CLYDE_SHY_DISTANCE_SQUARED = (TILEWIDTH * 8) * (TILEWIDTH * 8)
+
 
 class Ghost(Entity):
     """
@@ -142,10 +145,6 @@ class Ghost(Entity):
         dt : int
             The time increment.
         """
-        if self.name == BLINKY:
-            print(
-                f"""mode: {self.mode.current},goal: {self.goal},home: {self.homeNode.position},position: {self.position},direction: {self.direction},pacman: {self.pacman.position},direction_method: {self.directionMethod(self.directions)}"""
-            )
         dt = game.dt
         self.sprites.update(dt)
         self.mode.update(dt)
@@ -286,9 +285,9 @@ class Clyde(Ghost):
         self.goal = Vector2(0, TILEHEIGHT * NROWS)
 
     def chase(self):
-        d = self.pacman.position - self.position
-        ds = d.magnitude_squared()
-        if ds <= (TILEWIDTH * 8) ** 2:
+        dx = self.pacman.position.x - self.position.x
+        dy = self.pacman.position.y - self.position.y
+        if dx * dx + dy * dy <= CLYDE_SHY_DISTANCE_SQUARED:
             self.scatter()
         else:
             self.goal = (
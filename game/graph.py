@@ -1,5 +1,7 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import numpy as np
+
+# Adjacency columns
+UP, DOWN, LEFT, RIGHT = 0, 1, 2, 3
 
 # The given string representation
 maze_string = """
@@ -8,51 +10,80 @@ X X X X X X X X X X ...
 X X X X X X X X X X X X X X X X X X X X X X X X X X X X
 """
 
-# Convert the string representation to a 2D list
-maze_2d = [list(row.split()) for row in maze_string.strip().split("\n")]
-
-# Create a grid graph
-G = nx.grid_2d_graph(len(maze_2d), len(maze_2d[0]))
-
-for i in range(len(maze_2d)):
-    for j in range(len(maze_2d[0])):
-        G.nodes[(i, j)]["label"] = maze_2d[i][j]
-
-# Draw the graph
-pos = dict((n, n) for n in G.nodes())
-labels = nx.get_node_attributes(G, "label")
-nx.draw(G, pos, with_labels=True, labels=labels)
-plt.show()
 
+def parse_maze(maze_string):
+    """
+    Converts a maze string of single-character symbols separated by spaces
+    into a (rows, cols) uint8 array of the symbols' character codes.
+    """
+    rows = maze_string.strip().split("\n")
+    if len(set(len(row) for row in rows)) != 1:
+        raise ValueError("All maze rows must have the same width")
+    cleaned = " ".join(rows).encode()
+    return np.frombuffer(cleaned, dtype=np.uint8)[::2].reshape(len(rows), -1)
+
+
+def create_grid_graph(rows, cols, wrap=False):
+    """
+    Builds the adjacency of a rows x cols grid as an (rows * cols, 4) array.
+
+    Node (x, y) is labelled y * cols + x and row n of the array holds the labels
+    of its UP, DOWN, LEFT and RIGHT neighbors, or -1 where there is none.
+    With wrap set, the edges of the grid connect around to the opposite side.
+    """
+    idx = np.arange(rows * cols, dtype=np.int32).reshape(rows, cols)
+    nbrs = np.full((rows * cols, 4), -1, dtype=np.int32)
+    if wrap:
+        nbrs[:, UP] = np.roll(idx, 1, axis=0).ravel()
+        nbrs[:, DOWN] = np.roll(idx, -1, axis=0).ravel()
+        nbrs[:, LEFT] = np.roll(idx, 1, axis=1).ravel()
+        nbrs[:, RIGHT] = np.roll(idx, -1, axis=1).ravel()
+    else:
+        nbrs[idx[1:, :].ravel(), UP] = idx[:-1, :].ravel()
+        nbrs[idx[:-1, :].ravel(), DOWN] = idx[1:, :].ravel()
+        nbrs[idx[:, 1:].ravel(), LEFT] = idx[:, :-1].ravel()
+        nbrs[idx[:, :-1].ravel(), RIGHT] = idx[:, 1:].ravel()
+
+    return nbrs
 
-import networkx as nx
-import matplotlib.pyplot as plt
 
+def coordinate_to_node_label(x, y, dim):
+    return y * dim + x
 
-def create_grid_graph(dim):
-    G = nx.grid_2d_graph(dim, dim)
 
-    # Wrap around the edges
-    for x in range(dim):
-        G.add_edge((x, 0), (x, dim - 1))
-        G.add_edge((0, x), (dim - 1, x))
+def draw_grid_graph(nbrs, pos, labels):
+    import matplotlib.pyplot as plt
 
-    # Label nodes with integers instead of (x, y) coordinates
-    relabel_dict = {(x, y): y * dim + x for x, y in G.nodes()}
-    G = nx.relabel_nodes(G, relabel_dict)
+    for node, (x, y) in pos.items():
+        for other in nbrs[node]:
+            if other > node:
+                ox, oy = pos[other]
+                plt.plot([x, ox], [y, oy], color="black", zorder=1)
+    xs, ys = zip(*pos.values())
+    plt.scatter(xs, ys, s=400, color="lightblue", zorder=2)
+    for node, (x, y) in pos.items():
+        plt.annotate(str(labels[node]), (x, y), ha="center", va="center")
+    plt.axis("off")
+    plt.show()
 
-    return G
 
+def main():
+    # Create a grid graph of the maze and draw it with each node's maze symbol
+    board = parse_maze(maze_string)
+    rows, cols = board.shape
+    G = create_grid_graph(rows, cols)
+    pos = {y * cols + x: (y, x) for y in range(rows) for x in range(cols)}
+    labels = dict(enumerate(board.tobytes().decode()))
+    draw_grid_graph(G, pos, labels)
 
-def coordinate_to_node_label(x, y, dim):
-    return y * dim + x
+    # Create a 10x10 grid graph with wrap-around edges
+    dim = 10
+    G = create_grid_graph(dim, dim, wrap=True)
 
+    # Draw the graph with updated position mapping
+    pos = {(x + y * 10): (x, dim - 1 - y) for x in range(dim) for y in range(dim)}
+    draw_grid_graph(G, pos, {node: node for node in pos})
 
-# Create a 10x10 grid graph
-G = create_grid_graph(10)
 
-# Draw the graph with updated position mapping
-dim = 10
-pos = {(x + y * 10): (x, dim - 1 - y) for x in range(dim) for y in range(dim)}
-nx.draw(G, pos, with_labels=True, node_size=400, node_color="lightblue")
-plt.show()
+if __name__ == "__main__":
+    main()
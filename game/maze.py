@@ -122,8 +122,8 @@ class MazeBase(ABC):
         nodes.deny_access_list(*(self.add_offset(2, 3) + (LEFT, ghosts)))
         nodes.deny_access_list(*(self.add_offset(2, 3) + (RIGHT, ghosts)))
 
-        for direction in list(self.ghostNodeDeny.keys()):
-            for values in self.ghostNodeDeny[direction]:
+        for direction, tiles in self.ghostNodeDeny.items():
+            for values in tiles:
                 nodes.deny_access_list(*(values + (direction, ghosts)))
 
 
@@ -1,4 +1,4 @@
-from abc import ABC, abstractmethod
+import os
 import pygame
 from vector import Vector2
 from constants import *
@@ -10,8 +10,96 @@ if TYPE_CHECKING:
     from game.nodes import Node
     from game.entity import Entity
 
+# Cell codes produced by NodeGroup.encode_maze
+WALLCODE = 0
+NODECODE = 1
+PATHCODE = 2
+
+# Encoded mazes keyed by (maze file, modification time), shared by every
+# NodeGroup so a maze file is only parsed once per run
+MAZECODES = {}
+
+ENTITYACCESS = (
+    (1 << PACMAN)
+    | (1 << BLINKY)
+    | (1 << PINKY)
+    | (1 << INKY)
+    | (1 << CLYDE)
+    | (1 << FRUIT)
+)
+ALLACCESS = 0
+for _direction in MOVEDIRECTIONS:
+    ALLACCESS |= ENTITYACCESS << (_direction * ACCESSBITS)
+del _direction
+
+
+def access_mask(direction: int, entities: List["Entity"]) -> int:
+    """
+    Returns the access bits of every entity in the list for one direction.
+
+    Parameters
+    ----------
+    direction : int
+        The direction of the access bits
+    entities : List[Entity]
+        The entities whose bits are set
+
+    Returns
+    -------
+    int
+        The combined access mask
+    """
+    mask = 0
+    for entity in entities:
+        mask |= 1 << entity.name
+    return mask << (direction * ACCESSBITS)
 
-class Node(ABC):
+
+def symbol_codes(symbols: List[str]) -> np.ndarray:
+    """
+    Returns the character codes of a list of single-character maze symbols.
+
+    Parameters
+    ----------
+    symbols : List[str]
+        The maze symbols
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of the symbols' character codes
+    """
+    return np.frombuffer("".join(symbols).encode("ascii"), dtype=np.uint8)
+
+
+def find_row_edges(codes: np.ndarray) -> tuple:
+    """
+    Finds every pair of nodes that are next to each other in a row of the
+    encoded maze with only path cells between them, in one vectorized pass.
+
+    Pass the transposed codes to find the edges along columns.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        The maze layout encoded by NodeGroup.encode_maze
+
+    Returns
+    -------
+    tuple
+        Lists of the row, the left column and the right column of each edge
+    """
+    nodes = np.argwhere(codes == NODECODE)
+    walls = np.cumsum(codes == WALLCODE, axis=1)
+    start, end = nodes[:-1], nodes[1:]
+    connected = (start[:, 0] == end[:, 0]) & (
+        walls[end[:, 0], end[:, 1]] == walls[start[:, 0], start[:, 1]]
+    )
+    start, end = start[connected], end[connected]
+    return start[:, 0].tolist(), start[:, 1].tolist(), end[:, 1].tolist()
+
+
+class Node:
     """
     Provides a structured way to represent and manage nodes in a maze or grid.
 
@@ -21,29 +109,58 @@ class Node(ABC):
     Attributes
     ----------
     position : Vector2
-        The position of the node in the maze
-    neighbors : dict
-        A dictionary of the neighboring nodes, with the direction as the key
-    access : dict
-        A dictionary of the game entities that can move in each direction
+        The position of the node in the maze. Entities do vector arithmetic
+        with it, so code that only needs the coordinates should read
+        positionTuple instead
+    positionTuple : tuple
+        The position as a tuple, cached for rendering since nodes never move
+    positionInt : tuple
+        The position as a tuple of ints, cached for rendering
+    neighbors : list
+        The neighboring nodes, indexed by direction
+    access : int
+        Bitmask of the game entities that can move in each direction, see
+        ACCESSBITS in constants.py
+    validDirectionsCache : dict
+        The valid directions out of this node, keyed by (entity name, incoming direction)
+    goalOffsets : tuple
+        The (x, y) point one tile away from the node in each direction,
+        indexed by direction, used when steering entities towards a goal
 
     Methods
     -------
     deny_access(direction, entity)
-        Removes the entity from the list of entities that can move in the given direction
+        Clears the entity's access bit for the given direction
     allow_access(direction, entity)
-        Adds the entity to the list of entities that can move in the given direction
+        Sets the entity's access bit for the given direction
+    deny_access_list(direction, entities)
+        Clears the access bits of several entities for the given direction
+    allow_access_list(direction, entities)
+        Sets the access bits of several entities for the given direction
+    valid_directions(name, direction)
+        Returns the directions an entity can take out of this node
     render(screen)
         Draws the node and its connections on the screen
     """
 
+    __slots__ = (
+        "position",
+        "positionTuple",
+        "positionInt",
+        "neighbors",
+        "access",
+        "validDirectionsCache",
+        "goalOffsets",
+    )
+
     def __init__(self, x: int, y: int) -> None:
         """
         Initializes the node with a position using the Vector2 class.
 
-        Initializes a dictionary neighbors to store neighboring nodes in each direction.
+        Initializes a list neighbors to store neighboring nodes in each
+        direction, indexed by direction; the STOP slot is always empty.
 
-        Initializes a dictionary access to determine which game entities
+        Initializes a bitmask access to determine which game entities
         (PACMAN, BLINKY, PINKY, INKY, CLYDE, FRUIT) can move in each direction
         from this node.
 
@@ -55,13 +172,18 @@ class Node(ABC):
             The y coordinate of the node in the maze
         """
         self.position = Vector2(x, y)
-        self.neighbors = {UP: None, DOWN: None, LEFT: None, RIGHT: None, PORTAL: None}
-        self.access = {
-            UP: [PACMAN, BLINKY, PINKY, INKY, CLYDE, FRUIT],
-            DOWN: [PACMAN, BLINKY, PINKY, INKY, CLYDE, FRUIT],
-            LEFT: [PACMAN, BLINKY, PINKY, INKY, CLYDE, FRUIT],
-            RIGHT: [PACMAN, BLINKY, PINKY, INKY, CLYDE, FRUIT],
-        }
+        self.positionTuple = (x, y)
+        self.positionInt = (int(x), int(y))
+        self.neighbors = [None] * (PORTAL + 1)
+        self.access = ALLACCESS
+        self.validDirectionsCache = {}
+        self.goalOffsets = (
+            (x, y),  # STOP
+            (x, y - TILEWIDTH),  # UP
+            (x, y + TILEWIDTH),  # DOWN
+            (x - TILEWIDTH, y),  # LEFT
+            (x + TILEWIDTH, y),  # RIGHT
+        )
 
     def deny_access(self, direction: int, entity: "Entity") -> None:
         """
@@ -77,8 +199,8 @@ class Node(ABC):
         entity : 'Entity'
             The entity to deny access to
         """
-        if entity.name in self.access[direction]:
-            self.access[direction].remove(entity.name)
+        self.access &= ~(1 << (direction * ACCESSBITS + entity.name))
+        self.validDirectionsCache.clear()
 
     def allow_access(self, direction: int, entity: "Entity") -> None:
         """
@@ -92,8 +214,77 @@ class Node(ABC):
         entity : 'Entity'
             The entity to allow access to
         """
-        if entity.name not in self.access[direction]:
-            self.access[direction].append(entity.name)
+        self.access |= 1 << (direction * ACCESSBITS + entity.name)
+        self.validDirectionsCache.clear()
+
+    def deny_access_list(self, direction: int, entities: List["Entity"]) -> None:
+        """
+        Denies access for a list of entities in a given direction with a
+        single mask update.
+
+        Parameters
+        ----------
+        direction : int
+            The direction to deny access in
+        entities : List[Entity]
+            The entities to deny access to
+        """
+        self.access &= ~access_mask(direction, entities)
+        self.validDirectionsCache.clear()
+
+    def allow_access_list(self, direction: int, entities: List["Entity"]) -> None:
+        """
+        Allows access for a list of entities in a given direction with a
+        single mask update.
+
+        Parameters
+        ----------
+        direction : int
+            The direction to allow access in
+        entities : List[Entity]
+            The entities to allow access to
+        """
+        self.access |= access_mask(direction, entities)
+        self.validDirectionsCache.clear()
+
+    def valid_directions(self, name: int, direction: int) -> tuple:
+        """
+        Returns the directions an entity can take out of this node, excluding
+        the reverse of the direction it arrived in.
+
+        If there are none, the reverse direction is returned on its own.
+
+        The result only depends on the node's neighbors and access rules, so
+        it is computed once per (name, direction) and cached until access
+        for this node changes.
+
+        Parameters
+        ----------
+        name : int
+            The name of the entity
+        direction : int
+            The direction the entity is currently moving in
+
+        Returns
+        -------
+        tuple
+            The valid directions out of this node
+        """
+        key = (name, direction)
+        directions = self.validDirectionsCache.get(key)
+        if directions is None:
+            opposite = OPPOSITE[direction]
+            directions = tuple(
+                key
+                for key in MOVEDIRECTIONS
+                if key != opposite
+                and self.access >> (key * ACCESSBITS + name) & 1
+                and self.neighbors[key] is not None
+            )
+            if len(directions) == 0:
+                directions = (opposite,)
+            self.validDirectionsCache[(name, direction)] = directions
+        return directions
 
     def render(self, screen: pygame.Surface) -> None:
         """
@@ -108,15 +299,18 @@ class Node(ABC):
         screen : pygame.Surface
             The screen or surface to draw the node on
         """
-        for n in self.neighbors.keys():
-            if self.neighbors[n] is not None:
-                line_start = self.position.as_tuple()
-                line_end = self.neighbors[n].position.as_tuple()
-                pygame.draw.line(screen, WHITE, line_start, line_end, 4)
-                pygame.draw.circle(screen, RED, self.position.as_int(), 12)
+        connected = False
+        for neighbor in self.neighbors:
+            if neighbor is not None:
+                pygame.draw.line(
+                    screen, WHITE, self.positionTuple, neighbor.positionTuple, 4
+                )
+                connected = True
+        if connected:
+            pygame.draw.circle(screen, RED, self.positionInt, 12)
 
 
-class NodeGroup(ABC):
+class NodeGroup:
     """
     Provides a structured way to represent and manage groups of nodes in a
     maze or grid.
@@ -138,18 +332,28 @@ class NodeGroup(ABC):
         A list of symbols that represent paths in the maze file
     homekey : tuple
         The x and y coordinates of the home node
+    renderEdges : list
+        The (start, end) points of every connection, built on first render
+    renderCenters : list
+        The centers of every connected node, built on first render
+    renderSurface : pygame.Surface
+        The graph pre-drawn onto a transparent surface, None until rendered
 
     Methods
     -------
     read_maze_file(text_file)
         Reads the maze layout from a file and returns it as a NumPy array
-    create_node_table(data, xoffset, yoffset)
+    load_maze_codes(text_file)
+        Returns the encoded maze for a maze file, cached across NodeGroups
+    encode_maze(data)
+        Encodes the maze symbols as WALLCODE, NODECODE and PATHCODE cells
+    create_node_table(codes, xoffset, yoffset)
         Constructs nodes based on the maze data
     construct_key(x, y)
         Constructs a unique key for each node based on its x and y coordinates
-    connect_horizontally(data, xoffset, yoffset)
+    connect_horizontally(codes, xoffset, yoffset)
         Connect nodes horizontally based on the maze data
-    connect_vertically(data, xoffset, yoffset)
+    connect_vertically(codes, xoffset, yoffset)
         Connect nodes vertically based on the maze data
     get_start_temp_node()
         Get the starting node for the temporary pathfinding algorithm
@@ -181,6 +385,8 @@ class NodeGroup(ABC):
         Allows access for a list of entities to the home node
     render(screen)
         Renders all nodes and their connections on the provided screen (or surface)
+    build_render_lists()
+        Collects the connections and node centers drawn by render
     """
 
     def __init__(self, level: str) -> None:
@@ -200,16 +406,22 @@ class NodeGroup(ABC):
         self.nodesLUT = {}
         self.nodeSymbols = ["+", "P", "n"]
         self.pathSymbols = [".", "-", "|", "p"]
-        data = self.read_maze_file(level)
-        self.create_node_table(data)
-        self.connect_horizontally(data)
-        self.connect_vertically(data)
+        codes = self.load_maze_codes(level)
+        self.create_node_table(codes)
+        self.connect_horizontally(codes)
+        self.connect_vertically(codes)
         self.homekey = None
+        self.renderEdges = []
+        self.renderCenters = []
+        self.renderSurface = None
 
     def read_maze_file(self, text_file: str) -> np.ndarray:
         """
         Reads the maze layout from a file and returns it as a NumPy array.
 
+        The symbols are single ASCII characters separated by whitespace, so
+        the file is read as raw bytes rather than parsed as text.
+
         Parameters
         ----------
         text_file : str
@@ -218,33 +430,77 @@ class NodeGroup(ABC):
         Returns
         -------
         np.ndarray
-            A NumPy array containing the maze layout
+            A uint8 array of the maze symbols' character codes
         """
-        return np.loadtxt(text_file, dtype="<U1")
+        with open(text_file, "rb") as f:
+            raw = f.read()
+        nrows = sum(1 for line in raw.splitlines() if line.strip())
+        return np.frombuffer(b"".join(raw.split()), dtype=np.uint8).reshape(nrows, -1)
 
-    def create_node_table(
-        self, data: np.ndarray, xoffset: int = 0, yoffset: int = 0
-    ) -> None:
+    def load_maze_codes(self, text_file: str) -> np.ndarray:
         """
-        Constructs nodes based on the maze data.
+        Returns the encoded maze for a maze file, parsing and encoding it only
+        the first time the file is loaded (or after it changes on disk).
 
+        Parameters
+        ----------
+        text_file : str
+            The name of the maze file
 
+        Returns
+        -------
+        np.ndarray
+            A read-only array of the encoded maze, see encode_maze
+        """
+        key = (text_file, os.path.getmtime(text_file))
+        codes = MAZECODES.get(key)
+        if codes is None:
+            codes = self.encode_maze(self.read_maze_file(text_file))
+            codes.setflags(write=False)
+            MAZECODES[key] = codes
+        return codes
 
+    def encode_maze(self, data: np.ndarray) -> np.ndarray:
+        """
+        Encodes the maze symbols once as small ints, so the node table and
+        connection passes compare integers instead of strings.
 
         Parameters
         ----------
         data : np.ndarray
-            A NumPy array containing the maze layout
+            The maze layout, as character codes or single-character strings
+
+        Returns
+        -------
+        np.ndarray
+            An int8 array of WALLCODE, NODECODE and PATHCODE cells
+        """
+        if data.dtype != np.uint8:
+            data = np.char.encode(data, "ascii").view(np.uint8)
+        codes = np.full(data.shape, WALLCODE, dtype=np.int8)
+        codes[np.isin(data, symbol_codes(self.nodeSymbols))] = NODECODE
+        codes[np.isin(data, symbol_codes(self.pathSymbols))] = PATHCODE
+        return codes
+
+    def create_node_table(
+        self, codes: np.ndarray, xoffset: int = 0, yoffset: int = 0
+    ) -> None:
+        """
+        Constructs nodes based on the maze data.
+
+        Parameters
+        ----------
+        codes : np.ndarray
+            The maze layout encoded by encode_maze
         xoffset : int
             The x coordinate offset for the maze
         yoffset : int
             The y coordinate offset for the maze
         """
-        for row in list(range(data.shape[0])):
-            for col in list(range(data.shape[1])):
-                if data[row][col] in self.nodeSymbols:
-                    x, y = self.construct_key(col + xoffset, row + yoffset)
-                    self.nodesLUT[(x, y)] = Node(x, y)
+        rows, cols = np.nonzero(codes == NODECODE)
+        xs = ((cols + xoffset) * TILEWIDTH).tolist()
+        ys = ((rows + yoffset) * TILEHEIGHT).tolist()
+        self.nodesLUT.update({(x, y): Node(x, y) for x, y in zip(xs, ys)})
 
     def construct_key(self, x: int, y: int) -> tuple:
         """
@@ -265,70 +521,58 @@ class NodeGroup(ABC):
         return x * TILEWIDTH, y * TILEHEIGHT
 
     def connect_horizontally(
-        self, data: np.ndarray, xoffset: int = 0, yoffset: int = 0
+        self, codes: np.ndarray, xoffset: int = 0, yoffset: int = 0
     ) -> None:
         """
         Connect nodes horizontally based on the maze data.
 
         Parameters
         ----------
-        data : np.ndarray
-            A NumPy array containing the maze layout
+        codes : np.ndarray
+            The maze layout encoded by encode_maze
         xoffset : int
             The x coordinate offset for the maze
         yoffset : int
             The y coordinate offset for the maze
         """
-        for row in list(range(data.shape[0])):
-            key = None
-            for col in list(range(data.shape[1])):
-                if data[row][col] in self.nodeSymbols:
-                    if key is None:
-                        key = self.construct_key(col + xoffset, row + yoffset)
-                    else:
-                        otherkey = self.construct_key(col + xoffset, row + yoffset)
-                        self.nodesLUT[key].neighbors[RIGHT] = self.nodesLUT[otherkey]
-                        self.nodesLUT[otherkey].neighbors[LEFT] = self.nodesLUT[key]
-                        key = otherkey
-                elif data[row][col] not in self.pathSymbols:
-                    key = None
+        width, height = TILEWIDTH, TILEHEIGHT
+        for row, col, othercol in zip(*find_row_edges(codes)):
+            y = (row + yoffset) * height
+            node = self.nodesLUT[((col + xoffset) * width, y)]
+            othernode = self.nodesLUT[((othercol + xoffset) * width, y)]
+            node.neighbors[RIGHT] = othernode
+            othernode.neighbors[LEFT] = node
 
     def connect_vertically(
-        self, data: np.ndarray, xoffset: int = 0, yoffset: int = 0
+        self, codes: np.ndarray, xoffset: int = 0, yoffset: int = 0
     ) -> None:
         """
         Connect nodes vertically based on the maze data.
 
         Parameters
         ----------
-        data : np.ndarray
-            A NumPy array containing the maze layout
+        codes : np.ndarray
+            The maze layout encoded by encode_maze
         xoffset : int
             The x coordinate offset for the maze
         yoffset : int
             The y coordinate offset for the maze
         """
-        dataT = data.transpose()
-        for col in list(range(dataT.shape[0])):
-            key = None
-            for row in list(range(dataT.shape[1])):
-                if dataT[col][row] in self.nodeSymbols:
-                    if key is None:
-                        key = self.construct_key(col + xoffset, row + yoffset)
-                    else:
-                        otherkey = self.construct_key(col + xoffset, row + yoffset)
-                        self.nodesLUT[key].neighbors[DOWN] = self.nodesLUT[otherkey]
-                        self.nodesLUT[otherkey].neighbors[UP] = self.nodesLUT[key]
-                        key = otherkey
-                elif dataT[col][row] not in self.pathSymbols:
-                    key = None
+        width, height = TILEWIDTH, TILEHEIGHT
+        # Copy the transpose so the column scans walk contiguous memory
+        columns = np.ascontiguousarray(codes.T)
+        for col, row, otherrow in zip(*find_row_edges(columns)):
+            x = (col + xoffset) * width
+            node = self.nodesLUT[(x, (row + yoffset) * height)]
+            othernode = self.nodesLUT[(x, (otherrow + yoffset) * height)]
+            node.neighbors[DOWN] = othernode
+            othernode.neighbors[UP] = node
 
     def get_start_temp_node(self) -> Node:
         """
         Get the starting node for the temporary pathfinding algorithm.
         """
-        nodes = list(self.nodesLUT.values())
-        return nodes[0]
+        return next(iter(self.nodesLUT.values()))
 
     def set_portal_pair(self, pair1: tuple, pair2: tuple) -> None:
         """
@@ -343,9 +587,12 @@ class NodeGroup(ABC):
         """
         key1 = self.construct_key(*pair1)
         key2 = self.construct_key(*pair2)
-        if key1 in self.nodesLUT.keys() and key2 in self.nodesLUT.keys():
-            self.nodesLUT[key1].neighbors[PORTAL] = self.nodesLUT[key2]
-            self.nodesLUT[key2].neighbors[PORTAL] = self.nodesLUT[key1]
+        node1 = self.nodesLUT.get(key1)
+        node2 = self.nodesLUT.get(key2)
+        if node1 is not None and node2 is not None:
+            node1.neighbors[PORTAL] = node2
+            node2.neighbors[PORTAL] = node1
+            self.renderSurface = None
 
     def create_home_nodes(self, xoffset: int, yoffset: int) -> tuple:
         """
@@ -373,10 +620,12 @@ class NodeGroup(ABC):
             ]
         )
 
-        self.create_node_table(homedata, xoffset, yoffset)
-        self.connect_horizontally(homedata, xoffset, yoffset)
-        self.connect_vertically(homedata, xoffset, yoffset)
+        homecodes = self.encode_maze(homedata)
+        self.create_node_table(homecodes, xoffset, yoffset)
+        self.connect_horizontally(homecodes, xoffset, yoffset)
+        self.connect_vertically(homecodes, xoffset, yoffset)
         self.homekey = self.construct_key(xoffset + 2, yoffset)
+        self.renderSurface = None
         return self.homekey
 
     def connect_home_nodes(
@@ -394,9 +643,11 @@ class NodeGroup(ABC):
         direction : int
             The direction to connect the nodes in
         """
-        key = self.construct_key(*otherkey)
-        self.nodesLUT[homekey].neighbors[direction] = self.nodesLUT[key]
-        self.nodesLUT[key].neighbors[direction * -1] = self.nodesLUT[homekey]
+        homenode = self.nodesLUT[homekey]
+        othernode = self.nodesLUT[self.construct_key(*otherkey)]
+        homenode.neighbors[direction] = othernode
+        othernode.neighbors[OPPOSITE[direction]] = homenode
+        self.renderSurface = None
 
     def get_node_from_pixels(self, x_pixel: int, y_pixel: int) -> Node:
         """
@@ -414,9 +665,7 @@ class NodeGroup(ABC):
         Node
             The node at the given pixel coordinates
         """
-        if (x_pixel, y_pixel) in self.nodesLUT.keys():
-            return self.nodesLUT[(x_pixel, y_pixel)]
-        return None
+        return self.nodesLUT.get((x_pixel, y_pixel))
 
     def get_node_from_tiles(self, col: int, row: int) -> Node:
         """
@@ -434,10 +683,7 @@ class NodeGroup(ABC):
         Node
             The node at the given tile coordinates
         """
-        x, y = self.construct_key(col, row)
-        if (x, y) in self.nodesLUT.keys():
-            return self.nodesLUT[(x, y)]
-        return None
+        return self.nodesLUT.get((col * TILEWIDTH, row * TILEHEIGHT))
 
     def deny_access(self, col: int, row: int, direction: int, entity: "Entity") -> None:
         """
@@ -498,8 +744,9 @@ class NodeGroup(ABC):
         entities : List[Entity]
             The list of entities to deny access to
         """
-        for entity in entities:
-            self.deny_access(col, row, direction, entity)
+        node = self.get_node_from_tiles(col, row)
+        if node is not None:
+            node.deny_access_list(direction, entities)
 
     def allow_access_list(
         self, col: int, row: int, direction: int, entities: List["Entity"]
@@ -518,8 +765,9 @@ class NodeGroup(ABC):
         entities : List[Entity]
             The list of entities to allow access to
         """
-        for entity in entities:
-            self.allow_access(col, row, direction, entity)
+        node = self.get_node_from_tiles(col, row)
+        if node is not None:
+            node.allow_access_list(direction, entities)
 
     def deny_home_access(self, entity: "Entity") -> None:
         """
@@ -552,8 +800,7 @@ class NodeGroup(ABC):
         entities : List[Entity]
             The list of entities to deny access to
         """
-        for entity in entities:
-            self.deny_home_access(entity)
+        self.nodesLUT[self.homekey].deny_access_list(DOWN, entities)
 
     def allow_home_access_list(self, entities: List["Entity"]) -> None:
         """
@@ -564,17 +811,47 @@ class NodeGroup(ABC):
         entities : List[Entity]
             The list of entities to allow access to
         """
-        for entity in entities:
-            self.allow_home_access(entity)
+        self.nodesLUT[self.homekey].allow_access_list(DOWN, entities)
 
     def render(self, screen: pygame.Surface) -> None:
         """
         Renders all nodes and their connections on the provided screen (or surface).
 
+        The graph is drawn once onto a transparent surface, which is blitted
+        every frame and redrawn only after portals or home nodes change it.
+
         Parameters
         ----------
         screen : pygame.Surface
             The screen or surface to draw the nodes on
         """
+        if self.renderSurface is None:
+            self.build_render_lists()
+            self.renderSurface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+            for start, end in self.renderEdges:
+                pygame.draw.line(self.renderSurface, WHITE, start, end, 4)
+            circle = pygame.Surface((24, 24), pygame.SRCALPHA)
+            pygame.draw.circle(circle, RED, (12, 12), 12)
+            self.renderSurface.blits(
+                [(circle, (x - 12, y - 12)) for x, y in self.renderCenters]
+            )
+        screen.blit(self.renderSurface, (0, 0))
+
+    def build_render_lists(self) -> None:
+        """
+        Collects every connection once, regardless of which end it is stored
+        on, and the centers of all connected nodes for render.
+        """
+        self.renderEdges = []
+        self.renderCenters = []
+        seen = set()
         for node in self.nodesLUT.values():
-            node.render(screen)
+            for neighbor in node.neighbors:
+                if neighbor is None:
+                    continue
+                edge = frozenset((id(node), id(neighbor)))
+                if edge not in seen:
+                    seen.add(edge)
+                    self.renderEdges.append((node.positionTuple, neighbor.positionTuple))
+            if any(neighbor is not None for neighbor in node.neighbors):
+                self.renderCenters.append(node.positionInt)
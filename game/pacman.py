@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from game.nodes import Node
     from game.ghosts import Ghost
+    from game.pellets import PelletGroup
 
 
 class PacMan(Entity):
@@ -43,7 +44,7 @@ class PacMan(Entity):
         Updates the entity
     get_valid_key()
         Gets the key pressed by the player
-    eat_pellets(pellet_List)
+    eat_pellets(pellets)
         Checks if the entity has eaten a pellet
     collide_ghost(ghost)
         Checks if the entity has collided with a ghost
@@ -51,6 +52,8 @@ class PacMan(Entity):
         Checks if the entity has collided with another entity
     """
 
+    __slots__ = ("alive", "sprites")
+
     def __init__(self, node: "Node") -> None:
         Entity.__init__(self, node)
         self.name = PACMAN
@@ -87,6 +90,9 @@ class PacMan(Entity):
         portal transitions (like when Pac-Man goes off one side of the screen
         and appears on the other). It also checks for direction reversal.
 
+        The overshoot and reversal checks from Entity are inlined here, as
+        this runs every frame.
+
         Parameters
         ----------
         dt : float
@@ -94,28 +100,32 @@ class PacMan(Entity):
         """
         dt = game.dt
         self.sprites.update(dt)
-        self.position += self.directions[self.direction] * self.speed * dt
+        self.move(dt)
         direction = self.get_valid_key()
 
-        if self.over_shot_target():
-            self.node = self.target
-            if self.node.neighbors[PORTAL] is not None:
-                self.node = self.node.neighbors[PORTAL]
-            self.target = self.get_new_target(direction)
-            if self.target is not self.node:
+        start = self.node.position
+        end = self.target.position
+        tx = end.x - start.x
+        ty = end.y - start.y
+        sx = self.position.x - start.x
+        sy = self.position.y - start.y
+        if sx * sx + sy * sy >= tx * tx + ty * ty:
+            node = self.target
+            portal = node.neighbors[PORTAL]
+            if portal is not None:
+                node = portal
+            self.node = node
+            target = self.get_new_target(direction)
+            if target is not node:
                 self.direction = direction
             else:
-                self.target = self.get_new_target(self.direction)
-
-            if self.target is self.node:
-                self.direction = STOP
+                target = self.get_new_target(self.direction)
+                if target is node:
+                    self.direction = STOP
+            self.target = target
             self.set_position()
-        else:
-            if self.opposite_direction(direction):
-                self.reverse_direction()
-        # print(
-        #     f"pacman position: {self.position}, pacman direction: {self.direction}, pacman target: {self.target.position}"
-        # )
+        elif direction != STOP and direction == OPPOSITE[self.direction]:
+            self.reverse_direction()
 
     def get_valid_key(self) -> str:
         """
@@ -140,24 +150,33 @@ class PacMan(Entity):
             return RIGHT
         return STOP
 
-    def eat_pellets(self, pellet_List: list) -> Union[None, object]:
+    def eat_pellets(self, pellets: "PelletGroup") -> Union[None, object]:
         """
-        Checks for collisions between Pac-Man and any pellet in the provided list.
+        Checks for collisions between Pac-Man and any uneaten pellet in the
+        provided group.
 
         If a collision is detected, it returns the pellet that was "eaten".
 
+        Only the pellets in the tiles around Pac-Man are checked, using the
+        same test as collide_check inlined on scalar coordinates.
+
         Parameters
         ----------
-        pellet_List : list
-            A list of pellets to check for collisions with
+        pellets : PelletGroup
+            The pellets to check for collisions with
 
         Returns
         -------
         object
             The pellet that was "eaten" if a collision is detected, None otherwise
         """
-        for pellet in pellet_List:
-            if self.collide_check(pellet):
+        x = self.position.x
+        y = self.position.y
+        for pellet in pellets.nearby_pellets(x, y):
+            dx = x - pellet.position.x
+            dy = y - pellet.position.y
+            r = self.collideRadius + pellet.collideRadius
+            if dx * dx + dy * dy <= r * r:
                 return pellet
         return None
 
@@ -199,9 +218,7 @@ class PacMan(Entity):
         bool
             True if a collision is detected, False otherwise
         """
-        d = self.position - other.position
-        dSquared = d.magnitude_squared()
-        rSquared = (self.collideRadius + other.collideRadius) ** 2
-        if dSquared <= rSquared:
-            return True
-        return False
+        dx = self.position.x - other.position.x
+        dy = self.position.y - other.position.y
+        r = self.collideRadius + other.collideRadius
+        return dx * dx + dy * dy <= r * r
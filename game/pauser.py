@@ -1,3 +1,6 @@
+import math
+
+
 class Pause:
     """
     This class provides a structured way to handle pausing in a game.
@@ -12,7 +15,8 @@ class Pause:
     timer : float
         Elapsed time since the game was paused
     pause_time : float
-        Duration for which the game should be paused
+        Duration for which the game should be paused, or infinity when no
+        timed pause is set
     func : function
         Callback function to be executed after the pause duration is over
 
@@ -51,13 +55,13 @@ class Pause:
         """
         self.paused = paused
         self.timer = 0
-        self.pause_time = None
+        self.pause_time = math.inf
         self.func = None
 
     def update(self, dt: float) -> None:
         """
-        If a pause duration (pause_time) is set, this method increments the timer
-        by the time delta (dt).
+        Increments the timer by the time delta (dt). With no pause duration set,
+        pause_time is infinite, so the timer never reaches it.
 
         If the timer exceeds or equals the pause duration, it resets the timer,
         unpauses the game, and returns the callback function (func). This allows
@@ -70,14 +74,13 @@ class Pause:
         dt : float
             Time delta
         """
-        if self.pause_time is not None:
-            self.timer += dt
-            if self.timer >= self.pause_time:
-                self.timer = 0
-                self.paused = False
-                self.pause_time = None
-                return self.func
-        return None
+        self.timer += dt
+        if self.timer < self.pause_time:
+            return None
+        self.timer = 0
+        self.paused = False
+        self.pause_time = math.inf
+        return self.func
 
     def set_pause(
         self, player_paused: bool = False, pause_time=None, func=None
@@ -97,7 +100,7 @@ class Pause:
         """
         self.timer = 0
         self.func = func
-        self.pause_time = pause_time
+        self.pause_time = math.inf if pause_time is None else pause_time
         self.flip()
 
     def flip(self) -> None:
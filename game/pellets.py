@@ -28,6 +28,8 @@ class Pellet(ABC):
         Point value of the pellet
     visible : bool
         Whether the pellet is visible or not
+    index : int
+        Position of the pellet in its PelletGroup's creation order
 
     Methods
     -------
@@ -65,6 +67,7 @@ class Pellet(ABC):
         self.collideRadius = 2 * TILEWIDTH / 16
         self.points = 10
         self.visible = True
+        self.index = -1
 
     def render(self, screen: pygame.Surface) -> None:
         """
@@ -187,6 +190,11 @@ class PelletGroup:
         List of all power pellets in the game
     numEaten : int
         Number of pellets eaten by the player
+    pelletGrid : dict
+        The uneaten pellets in each tile, keyed by (column, row)
+    pelletLayer : pygame.Surface
+        The uneaten regular pellets pre-drawn onto a transparent surface, None
+        until rendered
 
     Methods
     -------
@@ -198,6 +206,12 @@ class PelletGroup:
         on the file's content.
     read_pellet_file(text_file)
         Reads the pellet layout from a file and returns it as a NumPy array.
+    build_grid()
+        Numbers the pellets and buckets them by tile.
+    nearby_pellets(x, y)
+        Returns the uneaten pellets in the tiles around a position.
+    remove_pellet(pellet)
+        Removes an eaten pellet.
     is_empty()
         Checks if the pellet_List is empty, i.e., all pellets have been eaten.
     render(screen)
@@ -225,6 +239,7 @@ class PelletGroup:
         self.powerpellets = []
         self.create_pellet_list(pellet_file)
         self.numEaten = 0
+        self.pelletLayer = None
 
     def update(self, dt: float) -> None:
         """
@@ -254,14 +269,96 @@ class PelletGroup:
             Path to the pellet file
         """
         data = self.read_pellet_file(pellet_file)
-        for row in range(data.shape[0]):
-            for col in range(data.shape[1]):
-                if data[row][col] in [".", "+"]:
+        nrows, ncols = data.shape
+        for row in range(nrows):
+            for col in range(ncols):
+                symbol = data.item(row, col)
+                if symbol in (".", "+"):
                     self.pellet_List.append(Pellet(row, col))
-                elif data[row][col] in ["P", "p"]:
+                elif symbol in ("P", "p"):
                     pp = PowerPellet(row, col)
                     self.pellet_List.append(pp)
                     self.powerpellets.append(pp)
+        self.build_grid()
+
+    def build_grid(self) -> None:
+        """
+        Numbers the pellets in creation order and buckets them by the tile
+        they sit in, so collision checks only need to look at the pellets
+        around Pac-Man.
+
+        Pellets never move, so this only runs once per level.
+        """
+        self.pelletGrid = {}
+        for index, pellet in enumerate(self.pellet_List):
+            pellet.index = index
+            cell = (
+                int(pellet.position.x // TILEWIDTH),
+                int(pellet.position.y // TILEHEIGHT),
+            )
+            self.pelletGrid.setdefault(cell, []).append(pellet)
+
+    def nearby_pellets(self, x: float, y: float) -> list:
+        """
+        Returns the uneaten pellets in the tile containing (x, y) and the eight
+        tiles around it, in creation order.
+
+        Anything that can reach a pellet is well within a tile of it, so no
+        other pellets need checking.
+
+        Parameters
+        ----------
+        x : float
+            x position to look around
+        y : float
+            y position to look around
+
+        Returns
+        -------
+        list
+            The nearby uneaten pellets
+        """
+        col = int(x // TILEWIDTH)
+        row = int(y // TILEHEIGHT)
+        grid = self.pelletGrid
+        nearby = []
+        for cell in (
+            (col - 1, row - 1),
+            (col, row - 1),
+            (col + 1, row - 1),
+            (col - 1, row),
+            (col, row),
+            (col + 1, row),
+            (col - 1, row + 1),
+            (col, row + 1),
+            (col + 1, row + 1),
+        ):
+            pellets = grid.get(cell)
+            if pellets:
+                nearby.extend(pellets)
+        if len(nearby) > 1:
+            nearby.sort(key=lambda pellet: pellet.index)
+        return nearby
+
+    def remove_pellet(self, pellet: Pellet) -> None:
+        """
+        Removes an eaten pellet from the pellet_List and its tile. Eaten power
+        pellets are also dropped from powerpellets so they stop being drawn.
+
+        Parameters
+        ----------
+        pellet : Pellet
+            The pellet that was eaten
+        """
+        self.pellet_List.remove(pellet)
+        self.pelletGrid[
+            (int(pellet.position.x // TILEWIDTH), int(pellet.position.y // TILEHEIGHT))
+        ].remove(pellet)
+        if pellet.name == POWERPELLET:
+            self.powerpellets.remove(pellet)
+        elif self.pelletLayer is not None:
+            x, y = pellet.position.as_int()
+            self.pelletLayer.fill((0, 0, 0, 0), (x, y, TILEWIDTH, TILEHEIGHT))
 
     def read_pellet_file(self, text_file: str) -> np.ndarray:
         """
@@ -307,10 +404,20 @@ class PelletGroup:
         """
         Renders all pellets in the pellet_List on the provided screen (or surface).
 
+        The regular pellets are drawn once onto pelletLayer, which is blitted in
+        a single call, and erased from it as they are eaten. Power pellets
+        flash, so they are still drawn individually.
+
         Parameters
         ----------
         screen : pygame.Surface
             Screen or surface on which the pellets are drawn
         """
-        for pellet in self.pellet_List:
-            pellet.render(screen)
+        if self.pelletLayer is None:
+            self.pelletLayer = pygame.Surface(SCREENSIZE, pygame.SRCALPHA)
+            for pellet in self.pellet_List:
+                if pellet.name == PELLET:
+                    pellet.render(self.pelletLayer)
+        screen.blit(self.pelletLayer, (0, 0))
+        for powerpellet in self.powerpellets:
+            powerpellet.render(screen)
@@ -1,6 +1,8 @@
+import random
 import pygame
 from pygame.locals import *
 from constants import *
+from entity import Entity
 from pacman import PacMan
 from nodes import NodeGroup
 from pellets import PelletGroup
@@ -47,17 +49,36 @@ class GameController:
         The time between background flashes
     flashTimer : float
         The current time since last background flash
+    backgrounds : tuple
+        The normal and flashing backgrounds
+    backgroundIndex : int
+        Index into backgrounds of the background being shown
     fruitCaptured : list
         A list of fruit images captured
+    fruitCapturedOffsets : set
+        The sprite sheet offsets of the captured fruit images
     fruitNode : Node
         The node where the fruit is located
     mazedata : MazeData
         The maze data object
+    mazeSprites : dict
+        The MazeSprites built for each maze, keyed by maze name
+    render_game : bool
+        Whether each frame is drawn to the screen
+    realtime : bool
+        Whether frames are paced to 30 FPS by the clock, or advanced by a fixed
+        1/30 second as fast as possible
+    running : bool
+        Whether the game loop should keep running
+    hudBlits : list
+        The (image, position) pairs for the life and captured fruit icons
 
     Methods
     -------
     set_background()
         Sets the background image
+    start_flash()
+        Starts flashing the background
     start_game()
         Starts the game
     update()
@@ -82,15 +103,29 @@ class GameController:
         Resets the current level
     update_score()
         Updates the score
+    build_hud_blits()
+        Lays out the life and captured fruit icons
     render()
         Renders the game
     """
 
-    def __init__(self, render_game: bool = True) -> None:
+    def __init__(
+        self, render_game: bool = True, realtime: bool = True, seed: int = None
+    ) -> None:
         self.render_game = render_game
+        self.realtime = realtime
+        self.running = True
+        # Every entity draws its random directions from one generator. Without
+        # an explicit seed it is seeded from the random module, so
+        # random.seed() still makes a game repeatable
+        Entity.seed_random(random.getrandbits(64) if seed is None else seed)
         if render_game:
             pygame.init()
         self.screen = pygame.display.set_mode(SCREENSIZE, 0, 32)
+        # Only quit and key presses are handled, so keep everything else,
+        # like mouse motion, out of the event queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, KEYDOWN])
         self.background = None
         self.background_norm = None
         self.background_flash = None
@@ -105,27 +140,48 @@ class GameController:
         self.flashBG = False
         self.flashTime = 0.2
         self.flashTimer = 0
+        self.backgrounds = (None, None)
+        self.backgroundIndex = 0
         self.fruitCaptured = []
+        self.fruitCapturedOffsets = set()
         self.fruitNode = None
         self.mazedata = MazeData()
+        self.mazeSprites = {}
+        self.hudBlits = []
+        self.build_hud_blits()
 
     def set_background(self) -> None:
         """
-        Sets up the game's background, including a normal background
-        and a flashing one.
+        Sets up the game's normal background.
+
+        The flashing background is only needed once the level is cleared, so
+        it is left to start_flash.
         """
         self.background_norm = pygame.surface.Surface(SCREENSIZE).convert()
         self.background_norm.fill(BLACK)
-        self.background_flash = pygame.surface.Surface(SCREENSIZE).convert()
-        self.background_flash.fill(BLACK)
         self.background_norm = self.mazesprites.construct_background(
             self.background_norm, self.level % 5
         )
+        self.textgroup.render_static(self.background_norm)
+        self.background_flash = None
+        self.flashBG = False
+        self.backgrounds = (self.background_norm, self.background_norm)
+        self.backgroundIndex = 0
+        self.background = self.background_norm
+
+    def start_flash(self) -> None:
+        """
+        Builds the flashing background for the current maze and starts
+        flashing between it and the normal one.
+        """
+        self.background_flash = pygame.surface.Surface(SCREENSIZE).convert()
+        self.background_flash.fill(BLACK)
         self.background_flash = self.mazesprites.construct_background(
             self.background_flash, 5
         )
-        self.flashBG = False
-        self.background = self.background_norm
+        self.textgroup.render_static(self.background_flash)
+        self.backgrounds = (self.background_norm, self.background_flash)
+        self.flashBG = True
 
     def start_game(self) -> None:
         """
@@ -147,41 +203,36 @@ class GameController:
         11. Set up the ghost access
         """
         self.mazedata.load_maze(self.level)
-        self.mazesprites = MazeSprites(
-            "game/assets/" + self.mazedata.obj.name + ".txt",
-            "game/assets/" + self.mazedata.obj.name + "_rotation.txt",
-        )
+        maze = self.mazedata.obj
+        maze_file = "game/assets/" + maze.name + ".txt"
+        # The sprite sheet and wall tiles never change, so each maze's
+        # sprites are loaded once and reused whenever its level comes round
+        self.mazesprites = self.mazeSprites.get(maze.name)
+        if self.mazesprites is None:
+            self.mazesprites = MazeSprites(
+                maze_file, "game/assets/" + maze.name + "_rotation.txt"
+            )
+            self.mazeSprites[maze.name] = self.mazesprites
         self.set_background()
-        self.nodes = NodeGroup("game/assets/" + self.mazedata.obj.name + ".txt")
-        self.mazedata.obj.set_portal_pairs(self.nodes)
-        self.mazedata.obj.connect_home_nodes(self.nodes)
-        self.pacman = PacMan(
-            self.nodes.get_node_from_tiles(*self.mazedata.obj.pacmanStart)
-        )
-        self.pellets = PelletGroup("game/assets/" + self.mazedata.obj.name + ".txt")
+        self.nodes = NodeGroup(maze_file)
+        maze.set_portal_pairs(self.nodes)
+        maze.connect_home_nodes(self.nodes)
+        get_node = self.nodes.get_node_from_tiles
+        self.pacman = PacMan(get_node(*maze.pacmanStart))
+        self.pellets = PelletGroup(maze_file)
         self.ghosts = GhostGroup(self.nodes.get_start_temp_node(), self.pacman)
 
-        self.ghosts.pinky.set_start_node(
-            self.nodes.get_node_from_tiles(*self.mazedata.obj.add_offset(2, 3))
-        )
-        self.ghosts.inky.set_start_node(
-            self.nodes.get_node_from_tiles(*self.mazedata.obj.add_offset(0, 3))
-        )
-        self.ghosts.clyde.set_start_node(
-            self.nodes.get_node_from_tiles(*self.mazedata.obj.add_offset(4, 3))
-        )
-        self.ghosts.set_spawn_node(
-            self.nodes.get_node_from_tiles(*self.mazedata.obj.add_offset(2, 3))
-        )
-        self.ghosts.blinky.set_start_node(
-            self.nodes.get_node_from_tiles(*self.mazedata.obj.add_offset(2, 0))
-        )
+        self.ghosts.pinky.set_start_node(get_node(*maze.add_offset(2, 3)))
+        self.ghosts.inky.set_start_node(get_node(*maze.add_offset(0, 3)))
+        self.ghosts.clyde.set_start_node(get_node(*maze.add_offset(4, 3)))
+        self.ghosts.set_spawn_node(get_node(*maze.add_offset(2, 3)))
+        self.ghosts.blinky.set_start_node(get_node(*maze.add_offset(2, 0)))
 
         self.nodes.deny_home_access(self.pacman)
         self.nodes.deny_home_access_list(self.ghosts)
         self.ghosts.inky.startNode.deny_access(RIGHT, self.ghosts.inky)
         self.ghosts.clyde.startNode.deny_access(LEFT, self.ghosts.clyde)
-        self.mazedata.obj.deny_ghosts_access(self.ghosts, self.nodes)
+        maze.deny_ghosts_access(self.ghosts, self.nodes)
 
     def update(self) -> None:
         """
@@ -191,7 +242,7 @@ class GameController:
 
         Also, handles the game's rendering.
 
-        1. Game clock is updated.
+        1. Game clock is updated, or a fixed step is used when not realtime.
         2. Update the text group, pellets, ghosts,and fruit. If the game is not
             paused, then the ghosts and fruit are updated.
         3. If Pacman is alive and the game is not paused, Pacman is updated.
@@ -200,13 +251,19 @@ class GameController:
         5. Pause is updated.
         6. Game checks for events and renders the game.
         """
-        dt = self.clock.tick(30) / 1000.0
+        if self.realtime:
+            dt = self.clock.tick(30) / 1000.0
+        else:
+            dt = 1.0 / 30.0
         self.dt = dt
         self.textgroup.update(dt)
         self.pellets.update(dt)
 
+        pause = self.pause
+        pacman = self.pacman
+
         # Update ghosts, fruit, and check for pellet events
-        if not self.pause.paused:
+        if not pause.paused:
             self.ghosts.update(self)
             if self.fruit is not None:
                 self.fruit.update(self)
@@ -215,24 +272,19 @@ class GameController:
             self.check_fruit_events()
 
         # Play when pacman is alive and not paused
-        if self.pacman.alive:
-            if not self.pause.paused:
-                self.pacman.update(self)
-        else:
-            self.pacman.update(self)
+        if not pause.paused or not pacman.alive:
+            pacman.update(self)
 
         # Flash background
         if self.flashBG:
             self.flashTimer += dt
             if self.flashTimer >= self.flashTime:
                 self.flashTimer = 0
-                if self.background == self.background_norm:
-                    self.background = self.background_flash
-                else:
-                    self.background = self.background_norm
+                self.backgroundIndex ^= 1
+                self.background = self.backgrounds[self.backgroundIndex]
 
         # Update pause
-        afterPauseMethod = self.pause.update(dt)
+        afterPauseMethod = pause.update(dt)
         if afterPauseMethod is not None:
             afterPauseMethod()
 
@@ -246,11 +298,11 @@ class GameController:
         Checks for user input events, like quitting the game or pausing.
 
         If the user presses the space bar, the game is paused.
-        If the user presses the escape key, the game is exited.
+        If the window is closed, the game loop is told to stop.
         """
-        for event in pygame.event.get():
+        for event in pygame.event.get((QUIT, KEYDOWN)):
             if event.type == QUIT:
-                exit()
+                self.running = False
             elif event.type == KEYDOWN:
                 if event.key == K_SPACE:
                     if self.pacman.alive:
@@ -272,7 +324,7 @@ class GameController:
         If Pacman eats all the pellets, the background flashes and the game is
             paused for 3 seconds before starting the next level.
         """
-        pellet = self.pacman.eat_pellets(self.pellets.pellet_List)
+        pellet = self.pacman.eat_pellets(self.pellets)
         if pellet:
             self.pellets.numEaten += 1
             self.update_score(pellet.points)
@@ -280,11 +332,11 @@ class GameController:
                 self.ghosts.inky.startNode.allow_access(RIGHT, self.ghosts.inky)
             if self.pellets.numEaten == 70:
                 self.ghosts.clyde.startNode.allow_access(LEFT, self.ghosts.clyde)
-            self.pellets.pellet_List.remove(pellet)
+            self.pellets.remove_pellet(pellet)
             if pellet.name == POWERPELLET:
                 self.ghosts.start_freight()
             if self.pellets.is_empty():
-                self.flashBG = True
+                self.start_flash()
                 self.hide_entities()
                 self.pause.set_pause(pause_time=3, func=self.next_level)
 
@@ -320,6 +372,7 @@ class GameController:
                     if self.pacman.alive:
                         self.lives -= 1
                         self.lifesprites.remove_image()
+                        self.build_hud_blits()
                         self.pacman.die()
                         self.ghosts.hide()
                         if self.lives <= 0:
@@ -349,13 +402,11 @@ class GameController:
                     8,
                     time=1,
                 )
-                fruitCaptured = False
-                for fruit in self.fruitCaptured:
-                    if fruit.get_offset() == self.fruit.image.get_offset():
-                        fruitCaptured = True
-                        break
-                if not fruitCaptured:
+                offset = self.fruit.image.get_offset()
+                if offset not in self.fruitCapturedOffsets:
+                    self.fruitCapturedOffsets.add(offset)
                     self.fruitCaptured.append(self.fruit.image)
+                    self.build_hud_blits()
                 self.fruit = None
             elif self.fruit.destroy:
                 self.fruit = None
@@ -399,6 +450,8 @@ class GameController:
         self.textgroup.show_text(READYTXT)
         self.lifesprites.reset_lives(self.lives)
         self.fruitCaptured = []
+        self.fruitCapturedOffsets = set()
+        self.build_hud_blits()
 
     def reset_level(self) -> None:
         """
@@ -427,7 +480,7 @@ class GameController:
         Renders all game entities and UI elements onto the screen.
 
         1. The background is rendered.
-        2. The nodes are rendered.
+        2. The nodes are rendered, if DEBUG_RENDER_NODES is set.
         3. The pellets are rendered.
         4. The fruit is rendered.
         5. Pacman is rendered.
@@ -436,32 +489,44 @@ class GameController:
         8. The lives sprites are rendered.
         9. The fruit captured sprites are rendered.
         """
-        self.screen.blit(self.background, (0, 0))
-        # self.nodes.render(self.screen) #! Why is this commented out?
-        self.pellets.render(self.screen)
+        screen = self.screen
+        screen.blit(self.background, (0, 0))
+        if DEBUG_RENDER_NODES:
+            self.nodes.render(screen)
+        self.pellets.render(screen)
         if self.fruit is not None:
-            self.fruit.render(self.screen)
-        self.pacman.render(self.screen)
-        self.ghosts.render(self.screen)
-        self.textgroup.render(self.screen)
-
-        # Lifesprites
-        for i in range(len(self.lifesprites.images)):
-            x = self.lifesprites.images[i].get_width() * i
-            y = SCREENHEIGHT - self.lifesprites.images[i].get_height()
-            self.screen.blit(self.lifesprites.images[i], (x, y))
-
-        # Fruit captured
-        for i in range(len(self.fruitCaptured)):
-            x = SCREENWIDTH - self.fruitCaptured[i].get_width() * (i + 1)
-            y = SCREENHEIGHT - self.fruitCaptured[i].get_height()
-            self.screen.blit(self.fruitCaptured[i], (x, y))
+            self.fruit.render(screen)
+        self.pacman.render(screen)
+        self.ghosts.render(screen)
+        self.textgroup.render(screen)
+
+        screen.blits(self.hudBlits, doreturn=False)
 
         pygame.display.update()
 
+    def build_hud_blits(self) -> None:
+        """
+        Lays out the life icons along the bottom left of the screen and the
+        captured fruit along the bottom right, so render can draw them all in
+        one blits call.
+
+        Called whenever a life is lost, a fruit is captured or the game
+        restarts.
+        """
+        self.hudBlits = []
+        for i, image in enumerate(self.lifesprites.images):
+            x = image.get_width() * i
+            y = SCREENHEIGHT - image.get_height()
+            self.hudBlits.append((image, (x, y)))
+        for i, image in enumerate(self.fruitCaptured):
+            x = SCREENWIDTH - image.get_width() * (i + 1)
+            y = SCREENHEIGHT - image.get_height()
+            self.hudBlits.append((image, (x, y)))
+
 
 if __name__ == "__main__":
     game = GameController()
     game.start_game()
-    while True:
+    while game.running:
         game.update()
+    pygame.quit()
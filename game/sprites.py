@@ -27,6 +27,8 @@ class Spritesheet(ABC):
     ----------
     sheet : pygame.Surface
         The sprite sheet image.
+    cutImages : dict
+        The sprites already cut from the sheet, keyed by (x, y, width, height).
 
     Methods
     -------
@@ -52,12 +54,16 @@ class Spritesheet(ABC):
         width = int(self.sheet.get_width() / BASETILEWIDTH * TILEWIDTH)
         height = int(self.sheet.get_height() / BASETILEHEIGHT * TILEHEIGHT)
         self.sheet = pygame.transform.scale(self.sheet, (width, height))
+        self.cutImages = {}
 
     def get_image(self, x: int, y: int, width: int, height: int) -> pygame.Surface:
         """
         Retrieves a specific sprite from the sprite sheet based on the given
         x, y, width, and height parameters.
 
+        Each sprite is cut from the sheet once and reused, since the animations
+        ask for the same few frames every update.
+
         Parameters
         ----------
         x : int
@@ -73,10 +79,13 @@ class Spritesheet(ABC):
         pygame.Surface
             The sprite at the specified x and y coordinates.
         """
-        x *= TILEWIDTH
-        y *= TILEHEIGHT
-        self.sheet.set_clip(pygame.Rect(x, y, width, height))
-        return self.sheet.subsurface(self.sheet.get_clip())
+        key = (x, y, width, height)
+        image = self.cutImages.get(key)
+        if image is None:
+            rect = pygame.Rect(x * TILEWIDTH, y * TILEHEIGHT, width, height)
+            image = self.sheet.subsurface(rect)
+            self.cutImages[key] = image
+        return image
 
 
 class PacManSprites(Spritesheet):
@@ -202,8 +211,8 @@ class PacManSprites(Spritesheet):
         """
         Resets all the animations to their initial state.
         """
-        for key in list(self.animations.keys()):
-            self.animations[key].reset()
+        for animation in self.animations.values():
+            animation.reset()
 
     def get_start_image(self) -> pygame.Surface:
         """
@@ -537,13 +546,20 @@ class MazeSprites(Spritesheet):
         A NumPy array of strings representing the maze layout.
     rot_data : np.ndarray
         A NumPy array of strings representing the rotation data for the maze layout.
+    tiles : list
+        The (x, y, rotation, position) of every wall tile, where y is None for
+        tiles drawn from the background's palette row
+    rotatedImages : dict
+        The rotated wall sprites, keyed by (x, y, rotation)
 
     Methods
     -------
     read_maze_file(maze_file)
         Reads the maze layout from a file and returns it as a NumPy array of strings.
+    build_tiles()
+        Lists the wall tiles to draw from the maze data.
     construct_background(background, y)
-        Constructs the maze background by iterating over the maze data (self.data).
+        Constructs the maze background from the wall tiles.
     rotate(sprite, value)
         Rotates the provided sprite by a specified angle.
     """
@@ -567,6 +583,8 @@ class MazeSprites(Spritesheet):
         Spritesheet.__init__(self)
         self.data = self.read_maze_file(maze_file)
         self.rot_data = self.read_maze_file(rot_file)
+        self.tiles = self.build_tiles()
+        self.rotatedImages = {}
 
     def get_image(self, x: int, y: int) -> pygame.Surface:
         """
@@ -604,18 +622,41 @@ class MazeSprites(Spritesheet):
         print(f'Loading maze file "{maze_file}"')
         return np.loadtxt(maze_file, dtype="<U1")
 
+    def build_tiles(self) -> list:
+        """
+        Lists every wall tile in the maze data with the sprite and rotation it
+        is drawn with, so the maze data is only scanned once however many
+        backgrounds are built from it.
+
+        A digit is a wall piece from the background's palette row, rotated by
+        the rotation data, and an "=" is the ghost home door.
+
+        Returns
+        -------
+        list
+            The (x, y, rotation, position) of every wall tile
+        """
+        tiles = []
+        for row in range(self.data.shape[0]):
+            for col in range(self.data.shape[1]):
+                symbol = self.data[row, col]
+                position = (col * TILEWIDTH, row * TILEHEIGHT)
+                if symbol.isdigit():
+                    rotval = int(self.rot_data[row, col])
+                    tiles.append((int(symbol) + 12, None, rotval, position))
+                elif symbol == "=":
+                    tiles.append((10, 8, 0, position))
+        return tiles
+
     def construct_background(
         self, background: pygame.Surface, y: int
     ) -> pygame.Surface:
         """
-        Constructs the maze background by iterating over the maze data (self.data).
-
-        For each cell in the maze data, it checks if the cell contains a digit
-        (indicating a specific sprite) or an "=" (indicating a specific sprite).
+        Constructs the maze background by drawing every wall tile listed in
+        self.tiles.
 
-        It then retrieves the appropriate sprite, rotates it based on the
-        rotation data (self.rot_data), and blits (draws) it onto the provided
-        background surface.
+        Each distinct sprite and rotation is only rotated once, and the tiles
+        are drawn onto the background with a single blits call.
 
         Parameters
         ----------
@@ -629,17 +670,17 @@ class MazeSprites(Spritesheet):
         pygame.Surface
             The background surface with the maze drawn on it.
         """
-        for row in list(range(self.data.shape[0])):
-            for col in list(range(self.data.shape[1])):
-                if self.data[row][col].isdigit():
-                    x = int(self.data[row][col]) + 12
-                    sprite = self.get_image(x, y)
-                    rotval = int(self.rot_data[row][col])
+        blits = []
+        for x, tile_y, rotval, position in self.tiles:
+            key = (x, y if tile_y is None else tile_y, rotval)
+            sprite = self.rotatedImages.get(key)
+            if sprite is None:
+                sprite = self.get_image(key[0], key[1])
+                if rotval:
                     sprite = self.rotate(sprite, rotval)
-                    background.blit(sprite, (col * TILEWIDTH, row * TILEHEIGHT))
-                elif self.data[row][col] == "=":
-                    sprite = self.get_image(10, 8)
-                    background.blit(sprite, (col * TILEWIDTH, row * TILEHEIGHT))
+                self.rotatedImages[key] = sprite
+            blits.append((sprite, position))
+        background.blits(blits, doreturn=False)
 
         return background
 
@@ -25,6 +25,8 @@ class Text(ABC):
         The visibility of the text.
     position : Vector2
         The position of the text.
+    positionTuple : tuple
+        The position of the text as an (x, y) tuple, for blitting.
     timer : int
         The timer for the text.
     lifespan : int
@@ -53,6 +55,21 @@ class Text(ABC):
         text object is visible.
     """
 
+    __slots__ = (
+        "id",
+        "text",
+        "color",
+        "size",
+        "visible",
+        "position",
+        "positionTuple",
+        "timer",
+        "lifespan",
+        "label",
+        "destroy",
+        "font",
+    )
+
     def __init__(
         self,
         text: str,
@@ -105,6 +122,7 @@ class Text(ABC):
         self.size = size
         self.visible = visible
         self.position = Vector2(x, y)
+        self.positionTuple = self.position.as_tuple()
         self.timer = 0
         self.lifespan = time
         self.label = None
@@ -127,19 +145,27 @@ class Text(ABC):
     def create_label(self) -> None:
         """
         Renders the text content into a label using the specified font and color.
+
+        The label is converted to the display's pixel format once here, so
+        blitting it every frame needs no per-pixel conversion.
         """
-        self.label = self.font.render(self.text, 1, self.color)
+        self.label = self.font.render(self.text, 1, self.color).convert_alpha()
 
     def set_text(self, new_text: str) -> None:
         """
         Updates the text content and recreates the label.
 
+        Rendering a label is slow, so nothing is done if the text is unchanged.
+
         Parameters
         ----------
         new_text : str
             The new text content.
         """
-        self.text = str(new_text)
+        new_text = str(new_text)
+        if new_text == self.text and self.label is not None:
+            return
+        self.text = new_text
         self.create_label()
 
     def update(self, dt: float) -> None:
@@ -172,18 +198,21 @@ class Text(ABC):
             The surface to render the text label onto.
         """
         if self.visible:
-            x, y = self.position.as_tuple()
-            screen.blit(self.label, (x, y))
+            screen.blit(self.label, self.positionTuple)
 
 
 class TextGroup(ABC):
     """ """
 
+    __slots__ = ("nextid", "alltext", "timedText", "staticText")
+
     def __init__(self) -> None:
         """
         Initializes the next available ID for text elements.
 
-        Initializes an empty dictionary alltext to store all the text elements.
+        Initializes an empty dictionary alltext to store all the text elements,
+        and timedText to store the ones with a lifespan. Labels that never
+        change go in staticText and are drawn into the background instead.
 
         Sets up predefined text elements using the setup_text method.
 
@@ -191,6 +220,8 @@ class TextGroup(ABC):
         """
         self.nextid = 10
         self.alltext = {}
+        self.timedText = {}
+        self.staticText = []
         self.setup_text()
         self.show_text(READYTXT)
 
@@ -232,10 +263,13 @@ class TextGroup(ABC):
         """
         self.nextid += 1
         self.alltext[self.nextid] = Text(text, color, x, y, size, time=time, id=id)
+        if time is not None:
+            self.timedText[self.nextid] = self.alltext[self.nextid]
         return self.nextid
 
     def remove_text(self, id):
         self.alltext.pop(id)
+        self.timedText.pop(id, None)
 
     def setup_text(self):
         size = TILEHEIGHT
@@ -252,14 +286,23 @@ class TextGroup(ABC):
         self.alltext[GAMEOVERTXT] = Text(
             "GAMEOVER!", YELLOW, 10 * TILEWIDTH, 20 * TILEHEIGHT, size, visible=False
         )
-        self.add_text("SCORE", WHITE, 0, 0, size)
-        self.add_text("LEVEL", WHITE, 23 * TILEWIDTH, 0, size)
+        self.staticText.append(Text("SCORE", WHITE, 0, 0, size))
+        self.staticText.append(Text("LEVEL", WHITE, 23 * TILEWIDTH, 0, size))
+
+    def render_static(self, surface):
+        # Draws the fixed labels onto a background, once per background
+        for text in self.staticText:
+            text.render(surface)
 
     def update(self, dt):
-        for tkey in list(self.alltext.keys()):
-            self.alltext[tkey].update(dt)
-            if self.alltext[tkey].destroy:
-                self.remove_text(tkey)
+        # Only timed text changes over time, and there is usually none
+        expired = []
+        for tkey, text in self.timedText.items():
+            text.update(dt)
+            if text.destroy:
+                expired.append(tkey)
+        for tkey in expired:
+            self.remove_text(tkey)
 
     def show_text(self, id):
         self.hide_text()
@@ -277,9 +320,10 @@ class TextGroup(ABC):
         self.update_text(LEVELTXT, str(level + 1).zfill(3))
 
     def update_text(self, id, value):
-        if id in self.alltext.keys():
-            self.alltext[id].set_text(value)
+        text = self.alltext.get(id)
+        if text is not None:
+            text.set_text(value)
 
     def render(self, screen):
-        for tkey in list(self.alltext.keys()):
-            self.alltext[tkey].render(screen)
+        for text in self.alltext.values():
+            text.render(screen)
@@ -49,11 +49,16 @@ class Vector2:
         Provides a string representation of the vector in the format <x, y>.
     """
 
+    __slots__ = ("x", "y")
+
+    thresh = 0.000001
+
     def __init__(self, x: int = 0, y: int = 0) -> None:
         """
         Initializes the vector's x and y components.
 
-        Sets a threshold (thresh) used for floating-point comparisons.
+        The threshold (thresh) used for floating-point comparisons is shared
+        by all vectors as a class attribute.
 
         Parameters
         ----------
@@ -64,7 +69,6 @@ class Vector2:
         """
         self.x = x
         self.y = y
-        self.thresh = 0.000001
 
     def __add__(self, other: "Vector2") -> "Vector2":
         """
@@ -188,7 +192,7 @@ class Vector2:
         int
             Squared magnitude of the vector
         """
-        return self.x**2 + self.y**2
+        return self.x * self.x + self.y * self.y
 
     def magnitude(self) -> float:
         """